@@ -12,15 +12,18 @@ BaselineVSLAMLab: A class to handle Visual SLAM baseline-related operations.
 """
 
 import os
+import sys
+import functools
 from pathlib import Path
 
+import atexit
+import shlex
 import signal
 import subprocess
 import psutil
 import threading
 import time
-import queue
-import pynvml
+from collections import deque
 from abc import ABC, abstractmethod
 from huggingface_hub import hf_hub_download
 
@@ -29,6 +32,117 @@ from path_constants import VSLAMLAB_BASELINES, TRAJECTORY_FILE_NAME
 
 SCRIPT_LABEL = f"\033[95m[{Path(__file__).name}]\033[0m "
 
+# GPU monitoring can be disabled entirely (NVML bindings are not even imported)
+GPU_MONITORING = os.environ.get("VSLAMLAB_DISABLE_GPU_MON", "0") != "1"
+
+# NVML is initialized once per process and shut down at exit
+_NVML_STATE = {"inited": False, "handle": None, "mem_used": None, "shutdown": None, "lock": threading.Lock()}
+
+def _init_nvml_mini():
+    from Baselines import _nvml_mini
+    _nvml_mini.init()
+    handle = _nvml_mini.get_handle(0) if _nvml_mini.device_count() > 0 else None
+    return handle, _nvml_mini.mem_used_bytes, _nvml_mini.shutdown
+
+def _init_pynvml():
+    import pynvml
+    pynvml.nvmlInit()
+    handle = pynvml.nvmlDeviceGetHandleByIndex(0) if pynvml.nvmlDeviceGetCount() > 0 else None
+    return handle, lambda gpu_handle: pynvml.nvmlDeviceGetMemoryInfo(gpu_handle).used, pynvml.nvmlShutdown
+
+def _ensure_nvml():
+    """Initialize NVML once and return the handle of GPU 0 (None if unavailable)."""
+    if not GPU_MONITORING:
+        return None
+    with _NVML_STATE["lock"]:
+        if not _NVML_STATE["inited"]:
+            _NVML_STATE["inited"] = True
+            # ctypes binding first, pynvml as fallback
+            for init_nvml in (_init_nvml_mini, _init_pynvml):
+                try:
+                    _NVML_STATE["handle"], _NVML_STATE["mem_used"], _NVML_STATE["shutdown"] = init_nvml()
+                    break
+                except Exception:
+                    pass # Library not available, no NVIDIA GPU or driver issue
+        return _NVML_STATE["handle"]
+
+def _gpu_memory_used(gpu_handle) -> int:
+    return _NVML_STATE["mem_used"](gpu_handle)
+
+def _shutdown_nvml():
+    if _NVML_STATE["shutdown"] is not None:
+        try:
+            _NVML_STATE["shutdown"]()
+        except Exception:
+            pass
+
+atexit.register(_shutdown_nvml)
+
+# Fields of /proc/meminfo needed by the memory monitor (values in kB)
+_MEMINFO_KEYS = (b"MemTotal:", b"MemAvailable:", b"SwapTotal:", b"SwapFree:")
+
+# Memory monitor thresholds and adaptive sampling interval (seconds)
+MAX_SWAP_PERC = 0.80
+MAX_RAM_PERC = 0.95
+MIN_MONITOR_INTERVAL, MAX_MONITOR_INTERVAL = 1.0, 30.0
+RAM_DELTA_BYTES = int(0.25 * 1024**3)
+
+@functools.lru_cache(maxsize=4096)
+def _execute_paths(exp_folder: str, dataset_path: str, dataset_folder: str, sequence_name: str) -> tuple[str, str, str, str]:
+    """(sequence_path, calibration_yaml, rgb_csv, exp_folder) of a run. Keyed by value: run_exp() builds new
+    experiment, baseline and dataset objects for every run."""
+    sequence_path = Path(dataset_path) / sequence_name
+    exp_sequence_folder = Path(exp_folder) / dataset_folder / sequence_name
+    return (str(sequence_path), str(sequence_path / 'calibration.yaml'),
+            str(exp_sequence_folder / 'rgb_exp.csv'), str(exp_sequence_folder))
+
+# is_installed() results per baseline name: run_exp() builds a new baseline object for every run
+_INSTALLED_CACHE: dict[str, tuple[bool, str]] = {}
+
+
+# /proc/meminfo is kept open across samples
+_MEMINFO_STATE = {"fd": None}
+
+def _read_meminfo() -> tuple[int, int, int, int]:
+    if _MEMINFO_STATE["fd"] is None:
+        _MEMINFO_STATE["fd"] = os.open('/proc/meminfo', os.O_RDONLY)
+    buffer = os.pread(_MEMINFO_STATE["fd"], 4096, 0)
+
+    values = []
+    for key in _MEMINFO_KEYS:
+        start = buffer.find(key)
+        if start < 0:
+            raise ValueError(f"{key.decode()} not found in /proc/meminfo")
+        start += len(key)
+        values.append(int(buffer[start:buffer.find(b"kB", start)]) * 1024)
+    ram_total, ram_available, swap_total, swap_free = values
+    return ram_total, ram_total - ram_available, swap_total, swap_total - swap_free
+
+def _read_system_memory() -> tuple[int, int, int, int]:
+    """Return (ram_total, ram_used, swap_total, swap_used) in bytes."""
+    if sys.platform == 'linux':
+        try:
+            return _read_meminfo()
+        except (OSError, ValueError):
+            pass # e.g. no MemAvailable (kernel < 3.14): psutil estimates it
+
+    ram, swap = psutil.virtual_memory(), psutil.swap_memory()
+    return ram.total, ram.total - ram.available, swap.total, swap.used
+
+def _sample_system_memory() -> dict:
+    """Read system RAM, swap and GPU memory (bytes). Called only at the sample points of execute()."""
+    ram_total, ram_used, swap_total, swap_used = _read_system_memory()
+    gpu_used = 0
+    gpu_handle = _ensure_nvml() # NVML is initialized once per process
+    if gpu_handle:
+        try:
+            gpu_used = _gpu_memory_used(gpu_handle)
+        except Exception:
+            pass # GPU stats failed, ignore
+
+    return {'ram_total': ram_total, 'ram_used': ram_used, 'swap_total': swap_total, 'swap_used': swap_used,
+            'gpu_used': gpu_used}
+
 
 class BaselineVSLAMLab(ABC):
     """Base baseline class for VSLAM-LAB."""
@@ -46,9 +160,14 @@ class BaselineVSLAMLab(ABC):
         # Paths
         self.baseline_path: Path = VSLAMLAB_BASELINES / baseline_folder
         self.settings_yaml: Path = self.baseline_path / f'vslamlab_{baseline_name}_settings.yaml'
+        self._settings_str: str = str(self.settings_yaml)
+
+        # Execute command prefix (completed with the mode)
+        self._pixi_prefix: str = f"pixi run --frozen -e {baseline_name} execute-"
 
         # Defaults parameters
         self.default_parameters = default_parameters
+        self._default_items = tuple(default_parameters.items()) if isinstance(default_parameters, dict) else ()
 
     @abstractmethod  
     def build_execute_command(self, exp_it, exp, dataset, sequence_name) -> str: ...
@@ -56,6 +175,12 @@ class BaselineVSLAMLab(ABC):
     @abstractmethod  
     def is_installed(self) -> bool: ...
 
+    def is_installed_cached(self) -> tuple[bool, str]:
+        """is_installed(), cached per baseline name until the next git_clone() or install()."""
+        if self.baseline_name not in _INSTALLED_CACHE:
+            _INSTALLED_CACHE[self.baseline_name] = self.is_installed()
+        return _INSTALLED_CACHE[self.baseline_name]
+
     def is_cloned(self) -> bool:
         return (self.baseline_path / '.git').is_dir()
     
@@ -69,11 +194,12 @@ class BaselineVSLAMLab(ABC):
             print(f"\n{SCRIPT_LABEL}git clone {self.label}\033[0m : {self.baseline_path}")
             print(f"{ws(6)} log file: {log_file_path}")
             subprocess.run(git_clone_command, shell=True, stdout=log_file, stderr=log_file)
+        _INSTALLED_CACHE.pop(self.baseline_name, None)
 
     ####################################################################################################################
     # Auxiliary methods    
     def install(self) -> None:
-        if self.is_installed()[0]:
+        if self.is_installed_cached()[0]:
             return
 
         # Ensure baseline directory exists before writing log file
@@ -85,6 +211,7 @@ class BaselineVSLAMLab(ABC):
             print(f"\n{SCRIPT_LABEL}Installing {self.label}\033[0m : {self.baseline_path}")
             print(f"{ws(6)} log file: {log_file_path}")
             subprocess.run(install_command, shell=True, stdout=log_file, stderr=log_file)
+        _INSTALLED_CACHE.pop(self.baseline_name, None)
 
     def check_installation(self) -> None:
         self.git_clone()
@@ -92,7 +219,7 @@ class BaselineVSLAMLab(ABC):
 
     def info_print(self) -> None:
         print(f'Name: {self.label}')
-        is_installed, install_msg = self.is_installed()
+        is_installed, install_msg = self.is_installed_cached()
 
         if is_installed:
             print_msg(f"{ws(0)}", f"Installed:\033[92m {install_msg}\033[0m", verb='LOW')
@@ -111,165 +238,173 @@ class BaselineVSLAMLab(ABC):
             _ = hf_hub_download(repo_id=f'vslamlab/{self.baseline_name}', filename=settings_yaml, repo_type='model', local_dir=self.baseline_path)
         return self.settings_yaml.is_file()
     
+    def _execute_mode(self, exp) -> str:
+        """Mode of the run: experiment parameters first, then the baseline defaults."""
+        default_mode = self.default_parameters.get('mode') if isinstance(self.default_parameters, dict) else None
+        mode = exp.parameters.get('mode') or default_mode
+        if not mode:
+            raise ValueError(f"No 'mode' for baseline {self.baseline_name}: set it in the experiment parameters or in the baseline default parameters")
+        return mode
+
     def build_execute_command_cpp(self, exp_it, exp, dataset, sequence_name):
-        sequence_path = dataset.dataset_path / sequence_name
-        exp_folder = Path(exp.folder) / dataset.dataset_folder / sequence_name
-        calibration_yaml = sequence_path / 'calibration.yaml'
-        rgb_exp_csv = exp_folder / 'rgb_exp.csv'
+        sequence_path, calibration_yaml, rgb_exp_csv, exp_folder = _execute_paths(
+            str(exp.folder), str(dataset.dataset_path), dataset.dataset_folder, sequence_name)
 
         vslamlab_command = [f"sequence_path:{sequence_path}",
                             f"calibration_yaml:{calibration_yaml}",
                             f"rgb_csv:{rgb_exp_csv}",
                             f"exp_folder:{exp_folder}",
                             f"exp_id:{exp_it}",
-                            f"settings_yaml:{self.settings_yaml}"]
+                            f"settings_yaml:{self._settings_str}"]
 
-        for parameter_name, parameter_value in self.default_parameters.items():
-            if parameter_name in exp.parameters:
-                vslamlab_command += [f"{str(parameter_name)}:{str(exp.parameters[parameter_name])}"]
-            else:
-                vslamlab_command += [f"{str(parameter_name)}:{str(parameter_value)}"]
+        vslamlab_command += [f"{name}:{exp.parameters.get(name, value)}" for name, value in self._default_items]
 
-        mode_str = next((s for s in vslamlab_command if s.startswith("mode:")), None).replace("mode:", '')
-        return f"pixi run --frozen -e {self.baseline_name} execute-{mode_str} " + ' '.join(vslamlab_command)
+        mode_str = self._execute_mode(exp)
+        return f"{self._pixi_prefix}{mode_str} " + ' '.join(vslamlab_command)
 
     def build_execute_command_python(self, exp_it, exp, dataset, sequence_name):
-        sequence_path = dataset.dataset_path / sequence_name
-        exp_folder = Path(exp.folder) / dataset.dataset_folder / sequence_name
-        calibration_yaml = sequence_path / 'calibration.yaml'
-        rgb_exp_csv = exp_folder / 'rgb_exp.csv'
+        sequence_path, calibration_yaml, rgb_exp_csv, exp_folder = _execute_paths(
+            str(exp.folder), str(dataset.dataset_path), dataset.dataset_folder, sequence_name)
 
         vslamlab_command = [f"--sequence_path {sequence_path}",
                             f"--calibration_yaml {calibration_yaml}",
                             f"--rgb_csv {rgb_exp_csv}",
                             f"--exp_folder {exp_folder}",
                             f"--exp_it {exp_it}",
-                            f"--settings_yaml {self.settings_yaml}"]
+                            f"--settings_yaml {self._settings_str}"]
 
-        for parameter_name, parameter_value in self.default_parameters.items():
-            if parameter_name in exp.parameters:
-                vslamlab_command += [f"--{str(parameter_name)} {str(exp.parameters[parameter_name])}"]
-            else:
-                vslamlab_command += [f"--{str(parameter_name)} {str(parameter_value)}"]
+        vslamlab_command += [f"--{name} {exp.parameters.get(name, value)}" for name, value in self._default_items]
 
-        mode_str = next((s for s in vslamlab_command if s.startswith("--mode ")), None).replace("--mode ", '')
-        return f"pixi run --frozen -e {self.baseline_name} execute-{mode_str} " + ' '.join(vslamlab_command)
+        mode_str = self._execute_mode(exp)
+        return f"{self._pixi_prefix}{mode_str} " + ' '.join(vslamlab_command)
 
     ####################################################################################################################
     # Execute methods
     def kill_process(self, process):
-        os.killpg(os.getpgid(process.pid), signal.SIGTERM)  
-        try:
-            process.wait(timeout=5) 
-        except subprocess.TimeoutExpired:
-            os.killpg(os.getpgid(process.pid), signal.SIGKILL) 
-        print_msg(SCRIPT_LABEL, "Process killed.",'error')
+        pgid = os.getpgid(process.pid)
+        os.killpg(pgid, signal.SIGTERM)
 
-    def monitor_memory(self, process, interval, comment_queue, success_flag, memory_stats):
-        MAX_SWAP_PERC = 0.80
-        MAX_RAM_PERC= 0.95
+        # Poll so that a quick exit is noticed right away (up to 5 s before SIGKILL)
+        t_0 = time.monotonic()
+        while time.monotonic() - t_0 < 5:
+            if process.poll() is not None:
+                break
+            time.sleep(0.01)
+        else:
+            os.killpg(pgid, signal.SIGKILL)
+            process.wait()
+        print_msg(SCRIPT_LABEL, "Process killed.",'error')
 
-        # Initialize NVML safely
-        gpu_handle = None
+    def read_process_tree_rss(self, process) -> dict[int, tuple[str, int]]:
+        """Return {pid: (name, rss in bytes)} for the process and all its descendants."""
+        root = psutil.Process(process.pid)
+        tree_rss = {}
+        for p in [root] + root.children(recursive=True):
+            try:
+                tree_rss[p.pid] = (p.name(), p.memory_info().rss)
+            except psutil.Error:
+                pass # Process exited
+        return tree_rss
+
+    @staticmethod
+    def largest_process_msg(tree_rss) -> str:
+        if not tree_rss:
+            return ""
+        pid, (name, rss) = max(tree_rss.items(), key=lambda item: item[1][1])
+        return f" Largest process: {name} (pid {pid}, {rss / (1024**3):.1f} GB)."
+
+    def _start_memory_monitor(self, interval) -> dict:
+        """Take the initial memory snapshot; usage is reported as the increment over it (in bytes)."""
+        snapshot = _sample_system_memory()
+        ram_total, ram_used = snapshot['ram_total'], snapshot['ram_used']
+        swap_total, swap_used = snapshot['swap_total'], snapshot['swap_used']
+
+        self.memory_samples = deque(maxlen=4096) # (t, ram, swap, gpu) trace of the last run, in bytes
+        return {'interval': interval, 't_0': time.monotonic(),
+                'ram_0': ram_used, 'ram_total': ram_total, 'ram_limit': int(ram_total * MAX_RAM_PERC), 'ram_prev': ram_used,
+                'swap_0': swap_used, 'swap_total': swap_total, 'swap_limit': int(swap_total * MAX_SWAP_PERC),
+                'gpu_0': snapshot['gpu_used'], 'ram_inc': 0, 'swap_inc': 0, 'gpu_inc': 0}
+
+    def _kill_for_memory(self, process, msg, comments_list, success_flag) -> None:
+        print_msg(SCRIPT_LABEL, msg, 'error')
+        success_flag[0] = False
+
+        # Largest process of the baseline tree (for OOM attribution), read only when killing
         try:
-            pynvml.nvmlInit()
-            if pynvml.nvmlDeviceGetCount() > 0:
-                gpu_handle = pynvml.nvmlDeviceGetHandleByIndex(0)
-        except Exception:
-            pass # No NVIDIA GPU or driver issue
-
-        # Initial snapshots
-        swap_0 = psutil.swap_memory().used / (1024**3)
-        swap_max = psutil.swap_memory().total / (1024**3)
-        ram_0 = psutil.virtual_memory().used / (1024**3)
-        ram_max = psutil.virtual_memory().total / (1024**3)
+            tree_rss = self.read_process_tree_rss(process)
+        except psutil.Error:
+            tree_rss = {}
 
-        gpu_0 = 0
-        if gpu_handle:
-            try:
-                gpu_0 = pynvml.nvmlDeviceGetMemoryInfo(gpu_handle).used / (1024**3)
-            except Exception:
-                pass
+        comments_list.append(msg + ". Process killed." + self.largest_process_msg(tree_rss))
+        self.kill_process(process)
 
-        ram_inc_max, swap_inc_max, gpu_inc_max = 0, 0, 0      
-        while process.poll() is None: 
-            try:
-                # 1. Check System Safety (Global)
-                ram = psutil.virtual_memory()
-                swap = psutil.swap_memory()
-                
-                ram_used = ram.used / (1024**3)
-                swap_used = swap.used / (1024**3)
-                
-                ram_perc = ram_used / ram_max if ram_max > 0 else 0.0
-                swap_perc = swap_used / swap_max if swap_max > 0 else 0.0
-
-                if ram_perc > MAX_RAM_PERC:
-                    msg = f"RAM threshold exceeded: {ram_used:.1f}/{ram_max:.1f} GB (> {MAX_RAM_PERC:.0%})"
-                    print_msg(SCRIPT_LABEL, msg, 'error')
-                    success_flag[0] = False
-                    comment_queue.put(msg + ". Process killed.")
-                    self.kill_process(process)
-                    break
-                
-                if swap_perc > MAX_SWAP_PERC:
-                    msg = f"Swap threshold exceeded: {swap_used:.1f}/{swap_max:.1f} GB (> {MAX_SWAP_PERC:.0%})"
-                    print_msg(SCRIPT_LABEL, msg, 'error')
-                    success_flag[0] = False
-                    comment_queue.put(msg + ". Process killed.")
-                    self.kill_process(process)
-                    break
+    def _sample_memory(self, process, memory_stats, comments_list, success_flag) -> bool:
+        """Sample system memory. Returns False if the process was killed for exceeding a threshold."""
+        # 1. Check System Safety (Global)
+        snapshot = _sample_system_memory()
+        ram_used, swap_used, gpu_used = snapshot['ram_used'], snapshot['swap_used'], snapshot['gpu_used']
 
-                # 2. Track Usage Stats (Incremental)
-                ram_inc_max = max(ram_inc_max, ram_used - ram_0)
-                swap_inc_max = max(swap_inc_max, swap_used - swap_0)
+        if memory_stats['ram_total'] > 0 and ram_used > memory_stats['ram_limit']:
+            msg = f"RAM threshold exceeded: {ram_used / (1024**3):.1f}/{memory_stats['ram_total'] / (1024**3):.1f} GB (> {MAX_RAM_PERC:.0%})"
+            self._kill_for_memory(process, msg, comments_list, success_flag)
+            return False
 
-                if gpu_handle:
-                    try:
-                        gpu_used = pynvml.nvmlDeviceGetMemoryInfo(gpu_handle).used / (1024**3)
-                        gpu_inc_max = max(gpu_inc_max, gpu_used - gpu_0)
-                    except Exception:
-                        pass # GPU stats failed, ignore
+        if memory_stats['swap_total'] > 0 and swap_used > memory_stats['swap_limit']:
+            msg = f"Swap threshold exceeded: {swap_used / (1024**3):.1f}/{memory_stats['swap_total'] / (1024**3):.1f} GB (> {MAX_SWAP_PERC:.0%})"
+            self._kill_for_memory(process, msg, comments_list, success_flag)
+            return False
 
-                time.sleep(interval)
+        # 2. Track Usage Stats (Incremental)
+        memory_stats['ram_inc'] = max(memory_stats['ram_inc'], ram_used - memory_stats['ram_0'])
+        memory_stats['swap_inc'] = max(memory_stats['swap_inc'], swap_used - memory_stats['swap_0'])
+        memory_stats['gpu_inc'] = max(memory_stats['gpu_inc'], gpu_used - memory_stats['gpu_0'])
 
-            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                break
+        self.memory_samples.append((time.monotonic() - memory_stats['t_0'], ram_used, swap_used, gpu_used))
 
-        # Shutdown NVML if it was initialized
-        if gpu_handle:
-            try:
-                pynvml.nvmlShutdown()
-            except Exception:
-                pass
+        # 3. Adapt sampling interval: faster while RAM grows, slower while it is flat
+        if ram_used - memory_stats['ram_prev'] > RAM_DELTA_BYTES:
+            memory_stats['interval'] = max(MIN_MONITOR_INTERVAL, memory_stats['interval'] / 2)
+        else:
+            memory_stats['interval'] = min(MAX_MONITOR_INTERVAL, memory_stats['interval'] * 1.5)
+        memory_stats['ram_prev'] = ram_used
 
-        memory_stats['ram'] = ram_inc_max
-        memory_stats['swap'] = swap_inc_max
-        memory_stats['gpu'] = gpu_inc_max
+        return True
 
     def execute(self, command, exp_it, exp_folder, timeout_seconds=1*60*1000000):
         log_file_path = exp_folder / ("system_output_" + str(exp_it).zfill(5) + ".txt")
         comments = ""
-        comment_queue = queue.Queue()
+        comments_list = []
         success_flag = [True] 
-        memory_stats = {}
         with open(log_file_path, 'w') as log_file:
             print(f"{ws(8)}log file: {log_file_path}")
-            process = subprocess.Popen(command, shell=True, stdout=log_file, stderr=log_file, text=True, preexec_fn=os.setsid)
-            memory_thread = threading.Thread(target=self.monitor_memory, args=(process, 10, comment_queue, success_flag, memory_stats))
-            memory_thread.start()
-
+            # start_new_session gives the process its own group (as os.setsid) without preexec_fn
             try:
-                _, _ = process.communicate(timeout=timeout_seconds)
-            except subprocess.TimeoutExpired:
-                print_msg(SCRIPT_LABEL, f"Process took too long > {timeout_seconds} seconds",'error')
-                comments = f"Process took too long > {timeout_seconds} seconds. Process killed."
-                success_flag[0] = False
-                self.kill_process(process)
-            
-            memory_thread.join()
-            while not comment_queue.empty():
-                comments += comment_queue.get() + "\n"
+                process = subprocess.Popen(shlex.split(command), stdout=log_file, stderr=subprocess.STDOUT, start_new_session=True)
+            except (OSError, ValueError) as e:
+                # No shell to report it: e.g. command not found, not executable or unbalanced quotes
+                msg = f"Could not start command: {e}"
+                print_msg(SCRIPT_LABEL, msg, 'error')
+                log_file.write(msg + "\n")
+                return {"success": False, "comments": msg + "\n", "ram": 0.0, "swap": 0.0, "gpu": 0.0}
+            memory_stats = self._start_memory_monitor(interval=10)
+
+            # Output goes straight to the log file: wait for the process and sample memory in between
+            deadline = time.monotonic() + timeout_seconds
+            while True:
+                try:
+                    process.wait(timeout=max(0.0, min(memory_stats['interval'], deadline - time.monotonic())))
+                    break
+                except subprocess.TimeoutExpired:
+                    if time.monotonic() >= deadline:
+                        print_msg(SCRIPT_LABEL, f"Process took too long > {timeout_seconds} seconds",'error')
+                        comments = f"Process took too long > {timeout_seconds} seconds. Process killed."
+                        success_flag[0] = False
+                        self.kill_process(process)
+                        break
+                    if not self._sample_memory(process, memory_stats, comments_list, success_flag):
+                        break
+
+            comments += ''.join(comment + "\n" for comment in comments_list)
 
         if not (exp_folder / (str(exp_it).zfill(5) + f"_{TRAJECTORY_FILE_NAME}.csv")).exists():
             success_flag[0] = False
@@ -277,9 +412,9 @@ class BaselineVSLAMLab(ABC):
         return {
             "success": success_flag[0],
             "comments": comments,
-            "ram": memory_stats.get('ram', 'N/A'),
-            "swap": memory_stats.get('swap', 'N/A'),
-            "gpu": memory_stats.get('gpu', 'N/A')
+            "ram": memory_stats['ram_inc'] / (1024**3),
+            "swap": memory_stats['swap_inc'] / (1024**3),
+            "gpu": memory_stats['gpu_inc'] / (1024**3)
         }
 
     ####################################################################################################################
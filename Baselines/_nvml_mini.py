@@ -0,0 +1,58 @@
+"""
+Minimal ctypes binding to NVML: just enough to read the used memory of a GPU.
+Avoids importing pynvml for the memory monitor of BaselineVSLAMLab.
+
+"""
+
+import ctypes
+
+NVML_SUCCESS = 0
+
+_lib = None
+
+
+class NVMLError(Exception):
+    pass
+
+
+class _nvmlMemory_t(ctypes.Structure):
+    _fields_ = [("total", ctypes.c_ulonglong),
+                ("free", ctypes.c_ulonglong),
+                ("used", ctypes.c_ulonglong)]
+
+
+def _check(ret: int) -> None:
+    if ret != NVML_SUCCESS:
+        raise NVMLError(f"NVML error code {ret}")
+
+
+def init() -> None:
+    """Load libnvidia-ml and initialize NVML. Raises OSError if the library is missing."""
+    global _lib
+    if _lib is None:
+        _lib = ctypes.CDLL("libnvidia-ml.so.1")
+        _lib.nvmlDeviceGetHandleByIndex_v2.argtypes = [ctypes.c_uint, ctypes.POINTER(ctypes.c_void_p)]
+        _lib.nvmlDeviceGetMemoryInfo.argtypes = [ctypes.c_void_p, ctypes.POINTER(_nvmlMemory_t)]
+    _check(_lib.nvmlInit_v2())
+
+
+def shutdown() -> None:
+    _check(_lib.nvmlShutdown())
+
+
+def device_count() -> int:
+    count = ctypes.c_uint()
+    _check(_lib.nvmlDeviceGetCount_v2(ctypes.byref(count)))
+    return count.value
+
+
+def get_handle(index: int) -> ctypes.c_void_p:
+    handle = ctypes.c_void_p()
+    _check(_lib.nvmlDeviceGetHandleByIndex_v2(index, ctypes.byref(handle)))
+    return handle
+
+
+def mem_used_bytes(handle: ctypes.c_void_p) -> int:
+    memory = _nvmlMemory_t()
+    _check(_lib.nvmlDeviceGetMemoryInfo(handle, ctypes.byref(memory)))
+    return memory.used
@@ -6,11 +6,10 @@ class DEPTHPRO_baseline(BaselineVSLAMLab):
     def __init__(self):
         baseline_name = 'depthpro'
         baseline_folder = 'ml-depth-pro'
+        default_parameters = {'verbose': 1, 'max-depth': 8, 'min-depth': 0.5, 'anchor': 0}
 
         # Initialize the baseline
-        super().__init__(baseline_name, baseline_folder)
-
-        self.default_parameters = {'verbose': 1, 'max-depth': 8, 'min-depth': 0.5, 'anchor': 0}
+        super().__init__(baseline_name, baseline_folder, default_parameters)
 
     def build_execute_command(self, exp_it, exp, dataset, sequence_name):
         return super().build_execute_command_python(exp_it, exp, dataset, sequence_name)
@@ -1,4 +1,6 @@
+import shutil
 import tarfile
+import subprocess
 from pathlib import Path
 from huggingface_hub import hf_hub_download
 
@@ -40,7 +42,20 @@ class ORBSLAM2_baseline(BaselineVSLAMLab):
             print_msg(f"\n{SCRIPT_LABEL}", f"Download weights: {self.baseline_path}/ORBvoc.txt",'info')
             file_path = hf_hub_download(repo_id='vslamlab/orbslam2_vocabulary', filename='ORBvoc.txt.tar.gz', repo_type='model',
                                         local_dir=vocabulary_folder)
-            with tarfile.open(file_path, "r:gz") as tar:
+            self.extract_vocabulary(file_path, vocabulary_folder)
+
+    @staticmethod
+    def extract_vocabulary(file_path, vocabulary_folder) -> None:
+        # System tar (multi-threaded with pigz) is much faster than Python's gzip
+        if shutil.which('tar'):
+            compression = ['-I', 'pigz', '-xf'] if shutil.which('pigz') else ['-xzf']
+            subprocess.run(['tar', *compression, str(file_path), '-C', str(vocabulary_folder)], check=True)
+            return
+
+        with tarfile.open(file_path, "r:gz") as tar:
+            if hasattr(tarfile, 'data_filter'):
+                tar.extractall(path=vocabulary_folder, filter='data')
+            else:
                 tar.extractall(path=vocabulary_folder)
 
 
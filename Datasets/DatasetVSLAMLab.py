@@ -10,8 +10,8 @@ DatasetVSLAMLab: A class to handle Visual SLAM dataset-related operations.
 
 """
 
+import os
 import sys
-import yaml
 import shutil
 import subprocess
 from loguru import logger
@@ -19,7 +19,7 @@ from pathlib import Path
 from typing import List, Union
 from abc import ABC, abstractmethod
 
-from utilities import ws, print_msg
+from utilities import ws, print_msg, load_yaml_cached
 from path_constants import VSLAM_LAB_DIR
 from Datasets.DatasetVSLAMLab_calibration import (
     _get_rgb_yaml_section,
@@ -47,11 +47,11 @@ class DatasetVSLAMLab(ABC):
         self.dataset_path: Path = self.benchmark_path / self.dataset_folder
         self.yaml_file: Path = VSLAM_LAB_DIR / "Datasets" / "dataset_files" / f"dataset_{self.dataset_name}.yaml"
 
-        # Load YAML config
-        with open(self.yaml_file, "r", encoding="utf-8") as f:
-            cfg = yaml.safe_load(f) or {}
+        # Load YAML config (cached while the file is unchanged)
+        cfg = load_yaml_cached(self.yaml_file) or {}
 
         self.sequence_names: List[str] = cfg["sequence_names"]
+        self._name_to_idx: dict = {name: idx for idx, name in enumerate(self.sequence_names)}
         self.rgb_hz: float = float(cfg["rgb_hz"])
         self.modes: List[str] = cfg.get("modes", ["mono"])
         self.sequence_nicknames: List[str] = []
@@ -110,31 +110,39 @@ class DatasetVSLAMLab(ABC):
 
     def zip_sequence_folder(self, sequence_name: str) -> None:
         """
-        Zips the sequence folder using system zip (efficient for inode usage)
-        and removes the original directory ONLY if zipping succeeds.
+        Archives the sequence folder (efficient for inode usage) and removes the
+        original directory ONLY if archiving succeeds. Uses multi-threaded zstd
+        (sequence_name.tar.zst) when available and falls back to system zip.
         """
         msg = f"Zipping sequence {self.dataset_color}{sequence_name}\033[0m to save inodes..."
         print_msg(SCRIPT_LABEL, msg)
 
         sequence_path = self.dataset_path / sequence_name
-        zip_file = self.dataset_path / f"{sequence_name}.zip"
+        use_zstd = bool(shutil.which("zstd") and shutil.which("tar"))
+        if use_zstd:
+            archive_file = self.dataset_path / f"{sequence_name}.tar.zst"
+            # cwd=self.dataset_path ensures the archive contains the folder structure 'sequence_name/...'
+            cmd_archive = ["tar", "--use-compress-program", "zstd -T0 -3", "-cf", archive_file.name, sequence_name]
+            cmd_check = ["zstd", "-t", "-q", archive_file.name]
+        else:
+            archive_file = self.dataset_path / f"{sequence_name}.zip"
+            cmd_archive = ["zip", "-r", "-q", archive_file.name, sequence_name]
+            cmd_check = ["unzip", "-t", "-q", archive_file.name] if shutil.which("unzip") else None
 
         try:
-            # 1. Run zip -r -q (Quiet Recursive)
-            # cwd=self.dataset_path ensures the zip contains the folder structure 'sequence_name/...'
-            cmd_zip = ["zip", "-r", "-q", f"{sequence_name}.zip", sequence_name]
-            subprocess.run(cmd_zip, cwd=self.dataset_path, check=True)
+            # 1. Create the archive
+            subprocess.run(cmd_archive, cwd=self.dataset_path, check=True)
 
-            # 2. (Optional) Integrity Check similar to your script
-            # cmd_check = ["unzip", "-t", "-q", f"{sequence_name}.zip"]
-            # subprocess.run(cmd_check, cwd=self.dataset_path, check=True)
+            # 2. Integrity check (the original folder is removed afterwards)
+            if cmd_check:
+                subprocess.run(cmd_check, cwd=self.dataset_path, check=True, stdout=subprocess.DEVNULL)
 
             # 3. Remove original folder if file exists
-            if zip_file.is_file():
-                shutil.rmtree(sequence_path)
+            if archive_file.is_file():
+                self.remove_folder_in_background(sequence_path)
                 # logger.info(f"Successfully zipped and removed {sequence_name}")
             else:
-                logger.error(f"Zip file for {sequence_name} was not created! Keeping original data.")
+                logger.error(f"Archive for {sequence_name} was not created! Keeping original data.")
 
         except subprocess.CalledProcessError as e:
             logger.error(f"Zipping failed for {sequence_name}. Error: {e}")
@@ -142,6 +150,32 @@ class DatasetVSLAMLab(ABC):
         except Exception as e:
             logger.error(f"Unexpected error zipping {sequence_name}: {e}")
 
+    def remove_folder_in_background(self, folder_path: Path) -> None:
+        """
+        Moves the folder out of the way (atomic rename within the same filesystem)
+        and deletes it with a detached 'rm -rf', so the caller does not wait for it.
+        Leftover '.trash_*' folders from interrupted removals are deleted along with it.
+        """
+        with os.scandir(self.dataset_path) as it:
+            trash_paths = [entry.path for entry in it if entry.name.startswith(".trash_") and entry.is_dir(follow_symlinks=False)]
+
+        try:
+            if sys.platform == "win32" or not shutil.which("rm"):
+                for trash_path in trash_paths:
+                    shutil.rmtree(trash_path, ignore_errors=True)
+                shutil.rmtree(folder_path)
+                return
+
+            trash_path = self.dataset_path / f".trash_{folder_path.name}_{os.getpid()}"
+            os.rename(folder_path, trash_path)
+            trash_paths.append(str(trash_path))
+        except OSError as e:
+            logger.error(f"Archive of {folder_path.name} was created, but removing the original folder failed: {e}")
+            return
+
+        subprocess.Popen(["rm", "-rf", *trash_paths], start_new_session=True,
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
     ####################################################################################################################
     # Auxiliary methods
     def write_calibration_yaml(self, sequence_name: str, rgb=None, rgbd=None, imu=None) -> None:
@@ -164,13 +198,12 @@ class DatasetVSLAMLab(ABC):
             for imu_i in imu:
                 yaml_content_lines.extend(_get_imu_yaml_section(imu_i))
 
-        with open(calibration_yaml, 'w') as file:
-            for line in yaml_content_lines:
-                file.write(f"{line}\n")
+        with open(calibration_yaml, 'w', newline='') as file:
+            file.write("\n".join(yaml_content_lines) + "\n")
 
     def check_sequence_availability(self, sequence_name: str, verbose: bool = True) -> str:
         sequence_path = self.dataset_path / sequence_name
-        zip_path = self.dataset_path / f"{sequence_name}.zip"
+        archive_paths = (self.dataset_path / f"{sequence_name}.tar.zst", self.dataset_path / f"{sequence_name}.zip")
         if sequence_path.is_dir():
             sequence_complete = self.check_sequence_integrity(sequence_name, verbose=verbose)
             if sequence_complete:
@@ -178,7 +211,7 @@ class DatasetVSLAMLab(ABC):
             else:
                 return "corrupted"
 
-        if zip_path.is_file():
+        if any(archive_path.is_file() for archive_path in archive_paths):
             return "zipped"
 
         return "non-available"
@@ -186,9 +219,17 @@ class DatasetVSLAMLab(ABC):
     def check_sequence_integrity(self, sequence_name: str, verbose: bool) -> bool:
         sequence_path = self.dataset_path / sequence_name
 
+        # List the sequence folder once (DirEntry caches the file type)
+        try:
+            with os.scandir(sequence_path) as it:
+                entries = {entry.name: entry for entry in it}
+        except (FileNotFoundError, NotADirectoryError):
+            if verbose:
+                logger.error(f"\n{ws(4)}Missing Sequence folder: {sequence_path} !!!!!")
+            return False
+
         # Define requirements: (Path, Description, is_directory)
         requirements = [
-            (sequence_path, "Sequence folder", True),
             (sequence_path / 'rgb_0', "RGB folder", True),
             (sequence_path / 'rgb.csv', "RGB timestamp CSV", False),
             (sequence_path / 'calibration.yaml', "Calibration YAML", False),
@@ -201,7 +242,8 @@ class DatasetVSLAMLab(ABC):
         # Check all requirements
         complete_sequence = True
         for path_obj, desc, should_be_dir in requirements:
-            exists = path_obj.is_dir() if should_be_dir else path_obj.is_file()
+            entry = entries.get(path_obj.name)
+            exists = entry is not None and (entry.is_dir() if should_be_dir else entry.is_file())
             if not exists:
                 if verbose:
                     logger.error(f"\n{ws(4)}Missing {desc}: {path_obj} !!!!!")
@@ -213,7 +255,7 @@ class DatasetVSLAMLab(ABC):
     # Utils
 
     def contains_sequence(self, sequence_name_ref: str) -> bool:
-        return sequence_name_ref in self.sequence_names
+        return sequence_name_ref in self._name_to_idx
 
     def print_sequence_names(self) -> None:
         print(self.sequence_names)
@@ -228,5 +270,5 @@ class DatasetVSLAMLab(ABC):
         return self.sequence_nicknames
 
     def get_sequence_nickname(self, sequence_name_ref: str) -> str:
-        idx = self.sequence_names.index(sequence_name_ref)
+        idx = self._name_to_idx[sequence_name_ref]
         return self.sequence_nicknames[idx]
\ No newline at end of file
@@ -1,9 +1,17 @@
 import os, cv2
+import numpy as np
 from pathlib import Path
 from typing import List
 
 SCRIPT_LABEL = f"\033[95m[{Path(__file__).name}]\033[0m "
 
+# Identity sensor extrinsics, shared by datasets whose camera frame is the body frame (immutable)
+T_BS_IDENTITY = ((1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0), (0.0, 0.0, 1.0, 0.0), (0.0, 0.0, 0.0, 1.0))
+
+def _format_T_BS(T_BS) -> str:
+    """Flatten a 4x4 extrinsics matrix (ndarray or nested list) into a YAML flow sequence."""
+    return "[" + ', '.join(f"{x:.13f}" for x in np.asarray(T_BS, dtype=np.float64).ravel().tolist()) + "]"
+
 def _get_rgb_yaml_section(camera_params, sequence_name: str, dataset_path: Path) -> List[str]:
     """Generate YAML lines for rgb parameters."""
     # Get image dimensions
@@ -42,9 +50,7 @@ def _get_rgb_yaml_section(camera_params, sequence_name: str, dataset_path: Path)
     lines.append(f"     image_dimension: [{w}, {h}],")
     lines.append(f"     fps: {camera_params['fps']},")
 
-    T_BS_data = camera_params['T_BS']
-    flat_list_str = [f"{x:.13f}" for x in T_BS_data.flatten()]
-    lines.append("     T_BS: [" + ', '.join(flat_list_str) + "] # Sensor extrinsics wrt. the body-frame.")
+    lines.append(f"     T_BS: {_format_T_BS(camera_params['T_BS'])} # Sensor extrinsics wrt. the body-frame.")
 
     lines.append(f"    }}\n")
     return lines
@@ -76,9 +82,7 @@ def _get_imu_yaml_section(imu_params) -> List[str]:
     lines.append(f"     s_a: {imu_params['s_a']}, # scale factor for accelerometer measurements: a_true = s_a * a_meas + b_a")
     lines.append(f"     fps: {imu_params['fps']},")
 
-    T_BS_data = imu_params['T_BS']
-    flat_list_str = [f"{x:.13f}" for x in T_BS_data.flatten()]
-    lines.append("     T_BS: [" + ', '.join(flat_list_str) + "]  # Sensor extrinsics wrt. the body-frame.")
+    lines.append(f"     T_BS: {_format_T_BS(imu_params['T_BS'])}  # Sensor extrinsics wrt. the body-frame.")
 
     lines.append(f"    }}\n")
 
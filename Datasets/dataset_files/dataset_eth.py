@@ -120,11 +120,11 @@ class ETH_dataset(DatasetVSLAMLab):
     def remove_unused_files(self, sequence_name: str) -> None:
         sequence_path = self.dataset_path / sequence_name
 
-        if BENCHMARK_RETENTION != Retention.FULL:
+        if BENCHMARK_RETENTION is not Retention.FULL:
             for name in ("calibration.txt", "groundtruth.txt", "rgb.txt", "depth.txt", "associated.txt"):
                 (sequence_path / name).unlink(missing_ok=True)
 
-        if BENCHMARK_RETENTION == Retention.MINIMAL:
+        if BENCHMARK_RETENTION is Retention.MINIMAL:
             for mode in self.modes:
                 (self.dataset_path / f"{sequence_name}_{mode}.zip").unlink(missing_ok=True)
 
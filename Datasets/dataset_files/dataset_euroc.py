@@ -212,7 +212,7 @@ class EUROC_dataset(DatasetVSLAMLab):
         for rel in ("mav0", "__MACOSX"):
             with suppress(FileNotFoundError):
                 shutil.rmtree(seq / rel)
-        if BENCHMARK_RETENTION == Retention.MINIMAL:
+        if BENCHMARK_RETENTION is Retention.MINIMAL:
             (self.dataset_path / "machine_hall.zip").unlink(missing_ok=True)
             (self.dataset_path / "vicon_room1.zip").unlink(missing_ok=True)
             (self.dataset_path / "vicon_room2.zip").unlink(missing_ok=True)
@@ -166,9 +166,9 @@ class KITTI_dataset(DatasetVSLAMLab):
         for sequence_name in self.sequence_names:
             super().download_process(sequence_name)
 
-        if BENCHMARK_RETENTION != Retention.FULL:
+        if BENCHMARK_RETENTION is not Retention.FULL:
             (VSLAMLAB_BENCHMARK / f"dataset").unlink(missing_ok=True)
 
-        if BENCHMARK_RETENTION == Retention.MINIMAL:
+        if BENCHMARK_RETENTION is Retention.MINIMAL:
             (VSLAMLAB_BENCHMARK / f"data_odometry_gray.zip").unlink(missing_ok=True)
             (VSLAMLAB_BENCHMARK / f"data_odometry_poses.zip").unlink(missing_ok=True)
\ No newline at end of file
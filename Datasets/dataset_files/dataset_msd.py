@@ -214,5 +214,5 @@ class MSD_dataset(DatasetVSLAMLab):
     def remove_unused_files(self, sequence_name: str) -> None:
         sequence_path = self.dataset_path / sequence_name
 
-        if BENCHMARK_RETENTION == Retention.MINIMAL:
+        if BENCHMARK_RETENTION is Retention.MINIMAL:
             (sequence_path / "calibration.json").unlink(missing_ok=True)
\ No newline at end of file
@@ -135,9 +135,9 @@ class NUIM_dataset(DatasetVSLAMLab):
     def remove_unused_files(self, sequence_name: str) -> None:
         sequence_path = self.dataset_path / sequence_name
 
-        if BENCHMARK_RETENTION != Retention.FULL:
+        if BENCHMARK_RETENTION is not Retention.FULL:
             for name in ("associations.txt", "groundtruth.txt", "traj0.gt.freiburg"):
                 (sequence_path / name).unlink(missing_ok=True)
 
-        if BENCHMARK_RETENTION == Retention.MINIMAL:
+        if BENCHMARK_RETENTION is Retention.MINIMAL:
             (VSLAMLAB_BENCHMARK / f"{sequence_name}.tar.gz").unlink(missing_ok=True)
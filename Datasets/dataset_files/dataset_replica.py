@@ -1,21 +1,54 @@
 from __future__ import annotations
 
 import csv
-import yaml
-import os, shutil 
+import os
 import numpy as np
 from pathlib import Path
 from typing import Final, Any
-from scipy.spatial.transform import Rotation as R
 
 from Datasets.DatasetVSLAMLab import DatasetVSLAMLab
-from utilities import downloadFile, decompressFile
+from utilities import downloadFile, decompressFile, load_yaml_cached
 from path_constants import Retention, BENCHMARK_RETENTION, VSLAMLAB_BENCHMARK
 from Datasets.DatasetVSLAMLab_issues import _get_dataset_issue
+from Datasets.DatasetVSLAMLab_calibration import T_BS_IDENTITY
 
 CAMERA_PARAMS: Final = [600.0, 600.0, 599.5, 339.5] # Camera intrinsics (fx, fy, cx, cy)
 
 
+def _mat_to_quat_batch(Rm: np.ndarray) -> np.ndarray:
+    """
+    Rotation matrices (N, 3, 3) to unit quaternions (N, 4) as [x, y, z, w].
+    Shepperd's method: per matrix, the branch with the largest of [R00, R11, R22, trace]
+    is used for numerical stability. Same convention (and sign) as scipy's Rotation.from_matrix,
+    without its per-matrix overhead. Assumes proper rotation matrices.
+    """
+    n = Rm.shape[0]
+    diag = np.stack([Rm[:, 0, 0], Rm[:, 1, 1], Rm[:, 2, 2]], axis=1)
+    tr = diag.sum(axis=1)
+    choice = np.argmax(np.column_stack([diag, tr]), axis=1)
+
+    quats = np.empty((n, 4), dtype=np.float64)
+
+    # Trace branch
+    m = choice == 3
+    quats[m, 0] = Rm[m, 2, 1] - Rm[m, 1, 2]
+    quats[m, 1] = Rm[m, 0, 2] - Rm[m, 2, 0]
+    quats[m, 2] = Rm[m, 1, 0] - Rm[m, 0, 1]
+    quats[m, 3] = 1.0 + tr[m]
+
+    # Diagonal branches: i is the largest diagonal element, (i, j, k) a cyclic permutation
+    for i in range(3):
+        j, k = (i + 1) % 3, (i + 2) % 3
+        m = choice == i
+        quats[m, i] = 1.0 - tr[m] + 2.0 * Rm[m, i, i]
+        quats[m, j] = Rm[m, j, i] + Rm[m, i, j]
+        quats[m, k] = Rm[m, k, i] + Rm[m, i, k]
+        quats[m, 3] = Rm[m, k, j] - Rm[m, j, k]
+
+    quats /= np.linalg.norm(quats, axis=1, keepdims=True)
+    return quats
+
+
 class REPLICA_dataset(DatasetVSLAMLab):
     """REPLICA dataset helper for VSLAM-LAB benchmark."""
 
@@ -23,8 +56,7 @@ class REPLICA_dataset(DatasetVSLAMLab):
         super().__init__(dataset_name, Path(benchmark_path))
 
         # Load settings
-        with open(self.yaml_file, "r", encoding="utf-8") as f:
-            cfg = yaml.safe_load(f) or {}
+        cfg = load_yaml_cached(self.yaml_file) or {}
 
         # Get download url
         self.url_download_root: str = cfg["url_download_root"]
@@ -44,16 +76,23 @@ class REPLICA_dataset(DatasetVSLAMLab):
         download_url = self.url_download_root
 
         # Constants
-        compressed_file = Path(VSLAMLAB_BENCHMARK) / compressed_name_ext
-        decompressed_folder = Path(VSLAMLAB_BENCHMARK) / decompressed_name
+        compressed_file = VSLAMLAB_BENCHMARK / compressed_name_ext
+        decompressed_folder = VSLAMLAB_BENCHMARK / decompressed_name
 
         # Download the compressed file
         if not compressed_file.exists():
             downloadFile(download_url, VSLAMLAB_BENCHMARK)
 
-        if (not decompressed_folder.is_dir()) or (next(decompressed_folder.iterdir(), None) is None):
+        # Missing or empty folder: a single opendir answers both
+        try:
+            with os.scandir(decompressed_folder) as it:
+                decompressed_empty = next(it, None) is None
+        except (FileNotFoundError, NotADirectoryError):
+            decompressed_empty = True
+
+        if decompressed_empty:
             decompressFile(compressed_file, VSLAMLAB_BENCHMARK)
-            os.rename(Path(VSLAMLAB_BENCHMARK) / 'Replica', decompressed_folder)
+            os.rename(VSLAMLAB_BENCHMARK / 'Replica', decompressed_folder)
 
     def create_rgb_folder(self, sequence_name: str) -> None:
         sequence_path = self.dataset_path / sequence_name
@@ -64,35 +103,41 @@ class REPLICA_dataset(DatasetVSLAMLab):
         if not rgb_path.exists():
             results_path.rename(rgb_path)
             depth_path.mkdir(exist_ok=True)
-            for filename in os.listdir(rgb_path):
+            # Snapshot the listing: files are renamed inside the folder being listed
+            with os.scandir(rgb_path) as it:
+                entries = list(it)
+            # Same filesystem: a plain rename per file
+            for entry in entries:
+                filename = entry.name
                 if 'depth' in filename:
-                    old_file = rgb_path / filename
-                    new_file = depth_path / filename.replace('depth', '')
-                    shutil.move(old_file, new_file)
-
-                if 'frame' in filename:
-                    old_file = rgb_path / filename
-                    new_file = rgb_path / filename.replace('frame', '')
-                    old_file.rename(new_file)
+                    os.rename(entry.path, os.path.join(depth_path, filename.replace('depth', '')))
+                elif 'frame' in filename:
+                    os.rename(entry.path, os.path.join(rgb_path, filename.replace('frame', '')))
 
     def create_rgb_csv(self, sequence_name: str) -> None:
         sequence_path = self.dataset_path / sequence_name
         rgb_path = sequence_path / 'rgb_0'
         rgb_csv = sequence_path / 'rgb.csv'
 
-        rgb_files = [f for f in os.listdir(rgb_path) if (rgb_path / f).is_file()]
+        with os.scandir(rgb_path) as it:
+            rgb_files = [entry.name for entry in it if entry.is_file(follow_symlinks=False)]
         rgb_files.sort()
 
+        # All frames share one extension: resolve it once and slice it off
+        ext_len = len(os.path.splitext(rgb_files[0])[1]) if rgb_files else 0
+
+        # Frame index -> ns with exact integer math: 1e10 + idx * 1e9 / rgb_hz, rgb_hz = hz_num / hz_den
+        hz_num, hz_den = self.rgb_hz.as_integer_ratio()
+        rows = []
+        for filename in rgb_files:
+            name = filename[:len(filename) - ext_len]
+            ts = 10_000_000_000 + (int(name) * 1_000_000_000 * hz_den) // hz_num
+            rows.append((ts, f"rgb_0/{filename}", ts, f"depth_0/{name}.png"))
+
         with open(rgb_csv, 'w', newline='') as csvfile:
             writer = csv.writer(csvfile)
-            writer.writerow(['ts_rgb_0 (ns)', 'path_rgb_0', 'ts_depth_0 (ns)', 'path_depth_0']) 
-			
-            for filename in rgb_files:
-                name, _ = os.path.splitext(filename)
-                ts = float(name) / self.rgb_hz
-                ts_ns = int(1e10 + ts * 1e9)
-                depth_name = name + '.png'
-                writer.writerow([ts_ns, f"rgb_0/{filename}", ts_ns, f"depth_0/{depth_name}"])
+            writer.writerow(['ts_rgb_0 (ns)', 'path_rgb_0', 'ts_depth_0 (ns)', 'path_depth_0'])
+            writer.writerows(rows)
 
     def create_calibration_yaml(self, sequence_name: str) -> None:
         fx, fy, cx, cy = CAMERA_PARAMS
@@ -100,7 +145,7 @@ class REPLICA_dataset(DatasetVSLAMLab):
                 "cam_model": "pinhole", "focal_length": [fx, fy], "principal_point": [cx, cy],
                 "depth_factor": float(self.depth_factor),
                 "fps": float(self.rgb_hz),
-                "T_BS": np.eye(4)}        
+                "T_BS": T_BS_IDENTITY}        
         self.write_calibration_yaml(sequence_name=sequence_name, rgbd=[rgbd0])
 
     def create_groundtruth_csv(self, sequence_name: str) -> None:
@@ -110,38 +155,30 @@ class REPLICA_dataset(DatasetVSLAMLab):
         groundtruth_csv = sequence_path /'groundtruth.csv'
 
         # Read RGB timestamps from CSV (skip header)
-        rgb_timestamps_ns = []
-        with open(rgb_csv, 'r', newline='') as f:
-            reader = csv.reader(f)
-            _ = next(reader, None)  # skip header if present
-            for row in reader:
-                if not row:
-                    continue
-                rgb_timestamps_ns.append(float(row[0]))
+        rgb_timestamps_ns = np.loadtxt(rgb_csv, delimiter=',', skiprows=1, usecols=0, dtype=np.int64, ndmin=1)
+
+        # Read poses: traj.txt rows are row-major 3x4 [r00 r01 r02 tx r10 r11 r12 ty r20 r21 r22 tz]
+        # Lines past the last rgb timestamp are never used: stop parsing there
+        poses = np.loadtxt(traj_txt, dtype=np.float64, ndmin=2, max_rows=max(len(rgb_timestamps_ns), 1))
+        num_poses = min(len(poses), len(rgb_timestamps_ns)) # avoid index error if traj has extra lines
+        poses = poses[:num_poses]
+
+        rows = []
+        if num_poses > 0:
+            Rm = poses[:, [0, 1, 2, 4, 5, 6, 8, 9, 10]].reshape(-1, 3, 3)
+            t = poses[:, [3, 7, 11]]
+            quats = _mat_to_quat_batch(Rm)  # [x, y, z, w]
+            rows = [[ts_ns, *pose] for ts_ns, pose in zip(rgb_timestamps_ns.tolist(), np.hstack([t, quats]).tolist())]
 
         # Write groundtruth.csv with header
-        with open(traj_txt, 'r') as src, open(groundtruth_csv, 'w', newline='') as dst:
+        with open(groundtruth_csv, 'w', newline='') as dst:
             writer = csv.writer(dst)
             writer.writerow(["ts (ns)","tx (m)","ty (m)","tz (m)","qx","qy","qz","qw"])
-
-            for idx, line in enumerate(src):
-                if idx >= len(rgb_timestamps_ns):
-                    break  # avoid index error if traj has extra lines
-                vals = list(map(float, line.strip().split()))
-                # traj.txt assumed row-major 3x4: r00 r01 r02 tx r10 r11 r12 ty r20 r21 r22 tz
-                Rm = np.array([[vals[0], vals[1], vals[2]],
-                            [vals[4], vals[5], vals[6]],
-                            [vals[8], vals[9], vals[10]]], dtype=float)
-                tx, ty, tz = vals[3], vals[7], vals[11]
-
-                qx, qy, qz, qw = R.from_matrix(Rm).as_quat()  # [x, y, z, w]
-                ts_ns = rgb_timestamps_ns[idx]
-
-                writer.writerow([int(ts_ns), tx, ty, tz, qx, qy, qz, qw])
+            writer.writerows(rows)
 
     def remove_unused_files(self, sequence_name: str) -> None:
         sequence_path = self.dataset_path / sequence_name
-        if BENCHMARK_RETENTION != Retention.FULL:
+        if BENCHMARK_RETENTION is not Retention.FULL:
             (sequence_path / "traj.txt").unlink(missing_ok=True)
             (self.dataset_path / "cam_params.json").unlink(missing_ok=True)
             for ply_file in self.dataset_path.glob("*.ply"):
@@ -154,5 +191,5 @@ class REPLICA_dataset(DatasetVSLAMLab):
         for sequence_name in self.sequence_names:
             super().download_process(sequence_name)
 
-        if BENCHMARK_RETENTION == Retention.MINIMAL:
+        if BENCHMARK_RETENTION is Retention.MINIMAL:
             (VSLAMLAB_BENCHMARK / f"Replica.zip").unlink(missing_ok=True)
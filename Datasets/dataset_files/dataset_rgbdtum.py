@@ -150,11 +150,11 @@ class RGBDTUM_dataset(DatasetVSLAMLab):
 
     def remove_unused_files(self, sequence_name: str) -> None:
         sequence_path = self.dataset_path / sequence_name
-        if BENCHMARK_RETENTION != Retention.FULL:
+        if BENCHMARK_RETENTION is not Retention.FULL:
             for name in ("accelerometer.txt", "depth.txt", "groundtruth.txt", "rgb.txt"):
                 (sequence_path / name).unlink(missing_ok=True)
 
-        if BENCHMARK_RETENTION == Retention.MINIMAL:
+        if BENCHMARK_RETENTION is Retention.MINIMAL:
             (self.dataset_path / f"{sequence_name}.tgz").unlink(missing_ok=True)
 
     @staticmethod
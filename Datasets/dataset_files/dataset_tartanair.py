@@ -151,6 +151,6 @@ class TARTANAIR_dataset(DatasetVSLAMLab):
         if gt_folder.exists():
             shutil.rmtree(gt_folder)
 
-        if BENCHMARK_RETENTION == Retention.MINIMAL:
+        if BENCHMARK_RETENTION is Retention.MINIMAL:
             (VSLAMLAB_BENCHMARK / f"tartanair-test-mono-release.tar.gz").unlink(missing_ok=True)
             (VSLAMLAB_BENCHMARK / f"3p1sf0eljfwrz4qgbpc6g95xtn2alyfk.zip").unlink(missing_ok=True)
\ No newline at end of file
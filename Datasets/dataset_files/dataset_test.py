@@ -1,12 +1,29 @@
 import os
-import yaml
 import shutil
 import subprocess
-import numpy as np
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor
 
 from Datasets.DatasetVSLAMLab import DatasetVSLAMLab
+from Datasets.DatasetVSLAMLab_calibration import T_BS_IDENTITY
+from utilities import load_yaml_cached
 from PIL import Image
 
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff')
+RESAMPLE_FILTER = Image.Resampling.LANCZOS
+
+
+def _resize_one(src, dst, scale):
+    with Image.open(src) as img:
+        # Even width (clear the lowest bit) and height in integer math
+        w0, h0 = img.size
+        scaled_width = int(w0 * scale) & ~1
+        scaled_height = (scaled_width * h0) // w0
+
+        # Resize image
+        resized_img = img.resize((scaled_width, scaled_height), RESAMPLE_FILTER)
+        resized_img.save(dst)
+
 
 class TEST_dataset(DatasetVSLAMLab):
     def __init__(self, benchmark_path):
@@ -14,8 +31,7 @@ class TEST_dataset(DatasetVSLAMLab):
         super().__init__('test', benchmark_path)
 
         # Load settings from .yaml file
-        with open(self.yaml_file, 'r') as file:
-            data = yaml.safe_load(file)
+        data = load_yaml_cached(self.yaml_file) or {}
 
         # Get download url
         self.dataset_folder_raw = data['dataset_folder_raw']
@@ -38,19 +54,14 @@ class TEST_dataset(DatasetVSLAMLab):
         if not os.path.exists(rgb_path):
             os.makedirs(rgb_path)
 
-        for file in os.listdir(sequence_path_0):
-            if file.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff')):
-                with Image.open(os.path.join(sequence_path_0, file)) as img:
-                    scaled_width = int(img.size[0] * self.resolution_scale)
+        with os.scandir(sequence_path_0) as it:
+            files = [entry.name for entry in it if entry.name.lower().endswith(IMAGE_EXTENSIONS)]
+        srcs = [os.path.join(sequence_path_0, file) for file in files]
+        dsts = [os.path.join(rgb_path, file) for file in files]
 
-                    # Ensure new_width is even
-                    if scaled_width % 2 != 0:
-                        scaled_width -= 1
-                    scaled_height = int(scaled_width * img.size[1] / img.size[0])
-                    
-                    # Resize image
-                    resized_img = img.resize((scaled_width, scaled_height), Image.LANCZOS)
-                    resized_img.save(os.path.join(rgb_path, file))
+        # Pillow releases the GIL while decoding, resizing and encoding, so threads scale with cores
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(_resize_one, srcs, dsts, repeat(self.resolution_scale)))
 
     def create_rgb_folder(self, sequence_name):
         # Already created in download_sequence_data
@@ -61,15 +72,16 @@ class TEST_dataset(DatasetVSLAMLab):
         rgb_path = os.path.join(sequence_path, 'rgb_0')
         rgb_csv = os.path.join(sequence_path, 'rgb.csv')
 
-        frame_duration = 1.0 / self.fps
-
-        rgb_files = [f for f in os.listdir(rgb_path) if os.path.isfile(os.path.join(rgb_path, f))]
+        with os.scandir(rgb_path) as it:
+            rgb_files = [entry.name for entry in it if entry.is_file(follow_symlinks=False)]
         rgb_files.sort()
+
+        # Timestamp of frame i is floor(i * 1e9 / fps): no per-frame drift from a rounded frame duration
+        lines = [f"{int(iRGB * 1_000_000_000 // self.fps)},rgb_0/{filename}\n"
+                 for iRGB, filename in enumerate(rgb_files)]
         with open(rgb_csv, 'w') as file:
             file.write("ts_rgb_0 (ns),path_rgb_0\n")
-            for iRGB, filename in enumerate(rgb_files, start=0):
-                ts_ns = int(iRGB * frame_duration * 1e9)
-                file.write(f"{ts_ns},rgb_0/{filename}\n") 
+            file.writelines(lines)
 
     def create_calibration_yaml(self, sequence_name):
         rgb0 = {
@@ -80,7 +92,7 @@ class TEST_dataset(DatasetVSLAMLab):
             "principal_point": [6.15989309e+02, 3.94241763e+02],
             "distortion_coeffs": [-4.01668881e-01, 2.48067172e-01, -2.77075958e-03, 9.46080835e-05, -1.59405648e-01],
             "fps": float(self.fps),
-            "T_BS": np.eye(4)  
+            "T_BS": T_BS_IDENTITY  
         }
         self.write_calibration_yaml(sequence_name=sequence_name, rgb=[rgb0])
 
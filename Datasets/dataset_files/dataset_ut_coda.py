@@ -148,7 +148,7 @@ class UT_CODA_dataset(DatasetVSLAMLab):
         timestamps_folder: Path  = sequence_path / "timestamps"
         poses_folder: Path  = sequence_path / "poses"
 
-        if BENCHMARK_RETENTION == Retention.MINIMAL:
+        if BENCHMARK_RETENTION is Retention.MINIMAL:
             shutil.rmtree(calibration_folder, ignore_errors=True)
             shutil.rmtree(metadata_folder, ignore_errors=True)
             shutil.rmtree(timestamps_folder, ignore_errors=True)
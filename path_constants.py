@@ -6,10 +6,10 @@ from pathlib import Path
 VSLAM_LAB_DIR = Path(os.path.dirname(os.path.abspath(__file__)))
 VSLAM_LAB_PATH = Path(os.path.dirname(VSLAM_LAB_DIR))
 
-VSLAMLAB_BENCHMARK = "/localscratch/adamb14.20051346.0/VSLAM-LAB-Benchmark"
+VSLAMLAB_BENCHMARK = Path("/localscratch/adamb14.20051346.0/VSLAM-LAB-Benchmark")
 VSLAMLAB_EVALUATION = VSLAM_LAB_PATH / 'VSLAM-LAB-Evaluation'
 VSLAMLAB_BASELINES = VSLAM_LAB_DIR / 'Baselines'
-VSLAMLAB_VIDEOS = "/localscratch/adamb14.20051346.0/VSLAM-LAB-Benchmark/VIDEOS"
+VSLAMLAB_VIDEOS = Path("/localscratch/adamb14.20051346.0/VSLAM-LAB-Benchmark/VIDEOS")
 
 COMPARISONS_YAML_DEFAULT = VSLAM_LAB_DIR / 'configs' / 'comp_complete.yaml'
 EXP_YAML_DEFAULT = 'exp_debug.yaml'
@@ -24,7 +24,7 @@ ABLATION_PARAMETERS_CSV = 'log_ablation_parameters.csv'
 TRAJECTORY_FILE_NAME = 'KeyFrameTrajectory'
 SCRIPT_LABEL = f"\033[95m[{os.path.basename(__file__)}]\033[0m "
 
-class Retention(str, Enum):
+class Retention(Enum):
     MINIMAL="minimal"; STANDARD="standard"; FULL="full"
 BENCHMARK_RETENTION = Retention.STANDARD
 
@@ -38,18 +38,15 @@ VerbosityManager = {
 }
 
 def set_VSLAMLAB_path(new_path, file_path, target_line_start):
-    new_line = f"{target_line_start} \"{new_path}\""
+    new_line = f"{target_line_start} Path(\"{new_path}\")"
     print(f"{SCRIPT_LABEL}Set {new_line}")
 
     with open(file_path, 'r') as file:
         lines = file.readlines()
 
+    lines = [new_line + '\n' if line.strip().startswith(target_line_start) else line for line in lines]
     with open(file_path, 'w') as file:
-        for line in lines:
-            if line.strip().startswith(target_line_start):
-                file.write(new_line + '\n')
-            else:
-                file.write(line)
+        file.writelines(lines)
 
 if __name__ == "__main__":
 
@@ -1,5 +1,5 @@
 import shutil
-import os, sys, yaml, re
+import os, sys, yaml, re, copy
 import urllib.request
 import zipfile
 import py7zr
@@ -10,6 +10,7 @@ from colorama import Fore, Style
 import pandas as pd
 from pathlib import Path
 from typing import Any
+from collections import OrderedDict
 
 from path_constants import VSLAM_LAB_DIR, VSLAMLAB_VERBOSITY, VerbosityManager
 
@@ -74,6 +75,27 @@ def load_yaml_file(yaml_file: str | Path) -> Any:
     
     return yaml_data
 
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader) # libyaml C parser when available
+_YAML_CACHE: "OrderedDict[str, tuple[int, int, Any]]" = OrderedDict() # path -> (mtime_ns, size, data)
+_YAML_CACHE_SIZE = 100
+
+def load_yaml_cached(yaml_file: str | Path) -> Any:
+    """Parse a YAML file, reusing the previous result while its mtime and size are unchanged."""
+    key = str(yaml_file)
+    stat = os.stat(key)
+    cached = _YAML_CACHE.get(key)
+    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    with open(key, "r", encoding="utf-8") as f:
+        yaml_data = yaml.load(f, Loader=_YamlLoader)
+    _YAML_CACHE[key] = (stat.st_mtime_ns, stat.st_size, yaml_data)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return copy.deepcopy(yaml_data)
+
 def find_common_sequences(experiments):
     num_experiments = len(experiments)
     exp_tmp = {}
@@ -255,7 +255,7 @@ def download_datasets(dataset_names: list[str]) -> None:
 
 def install_baseline(baseline_name: list[str]) -> None:
     baseline = get_baseline(baseline_name)
-    is_baseline_installed, _ = baseline.is_installed()
+    is_baseline_installed, _ = baseline.is_installed_cached()
     if not is_baseline_installed:
         baseline.git_clone()
         baseline.install()
@@ -312,7 +312,7 @@ def check_experiment_baselines_installed(exp_data: Any, exp_yaml: str | Path) ->
     baselines_to_install = []
     for baseline_name, exp_name in baselines.items():
         baseline = get_baseline(baseline_name)
-        is_baseline_installed, install_msg = baseline.is_installed()
+        is_baseline_installed, install_msg = baseline.is_installed_cached()
         if is_baseline_installed:
             print_msg(f"{ws(4)}", f"- {baseline.label}:\033[92m {install_msg}\033[0m", verb='LOW')
         else:    